@@ -4,10 +4,11 @@ Asteroid belt density field prototype.
 Generates noise-based density maps showing rivers, lakes, and oceans of rock.
 """
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import sys, os
 
+# matplotlib is imported inside the render_* functions so that importing this
+# module for asteroid_density()/ore_bias() alone doesn't pay for pyplot.
+
 # --- Simplex-like noise via permutation hash (no external deps) ---
 
 def _fade(t):
@@ -19,8 +20,9 @@ def _lerp(a, b, t):
 def _grad2(h, x, y):
     """Gradient from hash, 2D. Vectorized."""
     h = h & 7
-    u = np.where(h < 4, x, y)
-    v = np.where(h < 4, y, x)
+    lo = h < 4
+    u = np.where(lo, x, y)
+    v = np.where(lo, y, x)
     return np.where(h & 1, -u, u) + np.where(h & 2, -v, v)
 
 class PerlinNoise2D:
@@ -32,18 +34,24 @@ class PerlinNoise2D:
 
     def __call__(self, x, y):
         """Evaluate noise at (x, y). Works with numpy arrays."""
-        X = np.floor(x).astype(int) & 255
-        Y = np.floor(y).astype(int) & 255
-        xf = x - np.floor(x)
-        yf = y - np.floor(y)
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        X = x0.astype(int) & 255
+        Y = y0.astype(int) & 255
+        xf = x - x0
+        yf = y - y0
+        xf1 = xf - 1
+        yf1 = yf - 1
         u = _fade(xf)
         v = _fade(yf)
-        aa = self.perm[self.perm[X] + Y]
-        ab = self.perm[self.perm[X] + Y + 1]
-        ba = self.perm[self.perm[X + 1] + Y]
-        bb = self.perm[self.perm[X + 1] + Y + 1]
-        x1 = _lerp(_grad2(aa, xf, yf), _grad2(ba, xf - 1, yf), u)
-        x2 = _lerp(_grad2(ab, xf, yf - 1), _grad2(bb, xf - 1, yf - 1), u)
+        pa = self.perm[X]
+        pb = self.perm[X + 1]
+        aa = self.perm[pa + Y]
+        ab = self.perm[pa + Y + 1]
+        ba = self.perm[pb + Y]
+        bb = self.perm[pb + Y + 1]
+        x1 = _lerp(_grad2(aa, xf, yf), _grad2(ba, xf1, yf), u)
+        x2 = _lerp(_grad2(ab, xf, yf1), _grad2(bb, xf1, yf1), u)
         return _lerp(x1, x2, v)
 
 
@@ -104,26 +112,38 @@ def ore_bias(x, y, seed=432, world_scale=50000.0):
     noise_cu = PerlinNoise2D(seed + 65537)
     noise_cr = PerlinNoise2D(seed + 99991)
 
-    nx = x / world_scale
-    ny = y / world_scale
+    # All three layers sample the same frequency; scale the coordinates once.
+    nx = x / world_scale * 4.0
+    ny = y / world_scale * 4.0
 
-    fe = np.clip(noise_fe(nx * 4.0, ny * 4.0) + 0.5, 0.1, 1.0)
-    cu = np.clip(noise_cu(nx * 4.0, ny * 4.0) + 0.5, 0.1, 1.0)
-    cr = np.clip(noise_cr(nx * 4.0, ny * 4.0) + 0.5, 0.1, 1.0)
+    fe = np.clip(noise_fe(nx, ny) + 0.5, 0.1, 1.0)
+    cu = np.clip(noise_cu(nx, ny) + 0.5, 0.1, 1.0)
+    cr = np.clip(noise_cr(nx, ny) + 0.5, 0.1, 1.0)
 
     total = fe + cu + cr
     return fe / total, cu / total, cr / total
 
 
-def render_density_map(seed, filename, title, world_scale=50000.0):
-    """Render a single density map."""
-    res = 800
+def sample_grid(world_scale=50000.0, res=800):
+    """World-space sample grid shared by the map renderers.
+
+    X and Y are sparse (1 x res and res x 1); the noise functions broadcast
+    them, so only the outputs are materialized at full res x res.
+    """
     extent = world_scale * 1.2
     x = np.linspace(-extent, extent, res)
     y = np.linspace(-extent, extent, res)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)
+    return X, Y, extent
+
 
-    D = asteroid_density(X, Y, seed=seed, world_scale=world_scale)
+def render_density_map(seed, filename, title, world_scale=50000.0, grid=None, D=None):
+    """Render a single density map. Pass grid/D to reuse an already-sampled field."""
+    import matplotlib.pyplot as plt
+    import matplotlib.colors as mcolors
+    X, Y, extent = grid if grid is not None else sample_grid(world_scale)
+    if D is None:
+        D = asteroid_density(X, Y, seed=seed, world_scale=world_scale)
 
     fig, ax = plt.subplots(1, 1, figsize=(10, 10), facecolor='#080808')
     ax.set_facecolor('#080808')
@@ -160,15 +180,12 @@ def render_density_map(seed, filename, title, world_scale=50000.0):
     print(f"  saved {filename}")
 
 
-def render_ore_map(seed, filename, title, world_scale=50000.0):
-    """Render ore type distribution as RGB."""
-    res = 800
-    extent = world_scale * 1.2
-    x = np.linspace(-extent, extent, res)
-    y = np.linspace(-extent, extent, res)
-    X, Y = np.meshgrid(x, y)
-
-    D = asteroid_density(X, Y, seed=seed, world_scale=world_scale)
+def render_ore_map(seed, filename, title, world_scale=50000.0, grid=None, D=None):
+    """Render ore type distribution as RGB (grid/D as in render_density_map)."""
+    import matplotlib.pyplot as plt
+    X, Y, extent = grid if grid is not None else sample_grid(world_scale)
+    if D is None:
+        D = asteroid_density(X, Y, seed=seed, world_scale=world_scale)
     fe, cu, cr = ore_bias(X, Y, seed=seed, world_scale=world_scale)
 
     # RGB: ferrite=orange, cuprite=blue, crystal=green
@@ -177,7 +194,8 @@ def render_ore_map(seed, filename, title, world_scale=50000.0):
     B = D * (fe * 0.10 + cu * 0.85 + cr * 0.20)
 
     img = np.stack([R, G, B], axis=-1)
-    img = np.clip(img * 1.5, 0, 1)  # boost brightness
+    img *= 1.5  # boost brightness
+    np.clip(img, 0, 1, out=img)
 
     fig, ax = plt.subplots(1, 1, figsize=(10, 10), facecolor='#080808')
     ax.set_facecolor('#080808')
@@ -203,16 +221,27 @@ def render_ore_map(seed, filename, title, world_scale=50000.0):
     print(f"  saved {filename}")
 
 
+def render_seed(seed, outdir):
+    """Render both sample maps for one seed, sharing its density field."""
+    grid = sample_grid()
+    D = asteroid_density(grid[0], grid[1], seed=seed)
+    render_density_map(seed, f'{outdir}/density_{seed}.png',
+                      f'Asteroid Density — Seed {seed}', grid=grid, D=D)
+    render_ore_map(seed, f'{outdir}/ore_{seed}.png',
+                  f'Ore Distribution — Seed {seed}', grid=grid, D=D)
+    return seed
+
+
 if __name__ == '__main__':
+    from concurrent.futures import ProcessPoolExecutor
+
     outdir = 'docs/belt_samples'
     os.makedirs(outdir, exist_ok=True)
 
+    # Seeds are independent; render them in parallel, one process each.
     seeds = [432, 1337, 2037, 8080]
-    for seed in seeds:
-        print(f"Seed {seed}:")
-        render_density_map(seed, f'{outdir}/density_{seed}.png',
-                          f'Asteroid Density — Seed {seed}')
-        render_ore_map(seed, f'{outdir}/ore_{seed}.png',
-                      f'Ore Distribution — Seed {seed}')
+    with ProcessPoolExecutor(max_workers=min(len(seeds), os.cpu_count() or 1)) as pool:
+        for seed in pool.map(render_seed, seeds, [outdir] * len(seeds)):
+            print(f"Seed {seed}: done")
 
     print(f"\nDone. {len(seeds)} seeds × 2 maps = {len(seeds)*2} images in {outdir}/")